@@ -3,6 +3,7 @@ import os
 import subprocess
 import sys
 import venv
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -11,10 +12,19 @@ from data_as_code import __version__
 
 def menu(args=None):
     args = _parse_args(args)
-    args.func(args)
+    if args.command is None:  # if no command, print help to stderr
+        _build_parser().print_help(sys.stderr)
+        sys.exit(1)
+
+    _COMMANDS[args.command](args)
 
 
 def _parse_args(args: list = None):
+    return _build_parser().parse_args(args)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     program = 'data-as-code'
     parser = argparse.ArgumentParser(
         prog=program,
@@ -25,13 +35,12 @@ def _parse_args(args: list = None):
         version=f'{program} version {__version__}'
     )
 
-    commands = parser.add_subparsers(metavar='')
+    commands = parser.add_subparsers(metavar='', dest='command')
 
     # init submodule
     cmd_init = commands.add_parser(
         'init', help='initialize a project folder'
     )
-    cmd_init.set_defaults(func=initialize_folder)
     cmd_init.add_argument(
         '-d', type=str, default='.',
         help='path to project folder. Defaults to current directory'
@@ -45,69 +54,133 @@ def _parse_args(args: list = None):
         help='include git artifacts in folder'
     )
 
-    if not len(sys.argv) > 1:  # if no args, print help to stderr
-        parser.print_help(sys.stderr)
-        sys.exit(1)
-    else:
-        return parser.parse_args(args)
+    return parser
 
 
 def initialize_folder(arg: argparse.Namespace):
     _InitializeFolder(path=arg.d, exist_ok=arg.x)
 
 
+_COMMANDS = {
+    'init': initialize_folder,
+}
+
+
 class _InitializeFolder:
+    # (name, content) pairs; content of None denotes a folder
+    _scaffold = (
+        ('data', None),
+        ('metadata', None),
+        ('recipe.py', b'this is my recipe'),
+        ('.gitignore', b'data/'),
+    )
+
     def __init__(self, path: Union[Path, str] = None, exist_ok=False):
         self.wd = Path(path or '.').absolute()
         self.exist_ok = exist_ok
 
         self.wd.mkdir(exist_ok=True)
-        self.make_folder('data/')
-        self.make_folder('metadata/')
-        self.make_recipe('recipe.py')
-        self.make_gitignore('.gitignore')
-        self.make_pipenv()
-
-    def make_folder(self, folder):
-        Path(self.wd, folder).mkdir(exist_ok=self.exist_ok)
+        self.check_scaffold()  # before pipenv touches the folder
+        pipenv = self.make_pipenv()  # runs in the background during scaffolding
+        try:
+            self.scaffold()
+        except BaseException:
+            pipenv.kill()
+            pipenv.wait()
+            raise
+
+        output, _ = pipenv.communicate()
+        if pipenv.returncode != 0:
+            raise subprocess.CalledProcessError(
+                pipenv.returncode, pipenv.args, output=output
+            )
+
+    def check_scaffold(self):
+        """
+        Check for scaffolding collisions
+
+        A single listing of the working directory is compared against the
+        folders and files of the scaffold, unless existing objects are allowed.
+        This runs before pipenv is started, so a conflict leaves the folder
+        untouched.
+        """
+        if not self.exist_ok:
+            names = {x for x, _ in self._scaffold}
+            existing = sorted(names.intersection(os.listdir(self.wd)))
+            if existing:
+                raise FileExistsError(
+                    f"{', '.join(existing)} already exists in {self.wd}"
+                )
+
+    def scaffold(self):
+        """
+        Create the project folders and files
+        """
+        mode = 'wb' if self.exist_ok else 'xb'
+        for name, content in self._scaffold:
+            p = Path(self.wd, name)
+            if content is None:
+                p.mkdir(exist_ok=self.exist_ok)
+            else:
+                with open(p, mode) as f:
+                    f.write(content)
 
     def make_venv(self, folder):
         venv.create(Path(self.wd, folder))
 
-    def _make_file(self, x: str, txt: str):
-        p = Path(self.wd, x)
-        if p.exists() and self.exist_ok is False:
-            raise FileExistsError(f"{x} already exists in {self.wd}")
-        else:
-            if isinstance(txt, bytes):
-                p.write_bytes(txt)
-            else:
-                p.write_text(txt)
+    def make_pipenv(self) -> subprocess.Popen:
+        pipfile = Path(self.wd, 'Pipfile')
+        if not pipfile.exists():  # touching would make an existing lock stale
+            pipfile.touch()
+        return _pipenv_init(self.wd)
 
-    def make_recipe(self, file):
-        self._make_file(file, 'this is my recipe')
 
-    def make_pipenv(self):
-        cwd = os.getcwd()
-        try:
-            os.chdir(self.wd)
-            Path('Pipfile').touch()
-            _pipenv_init()
-        finally:
-            os.chdir(cwd)
+def _pip_freeze() -> bytes:
+    return subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
 
-    def make_gitignore(self, file):
-        patterns = [
-            'data/',
-        ]
-        txt = '\n'.join(patterns)
-        self._make_file(file, txt)
 
+_REQUIREMENTS = ('requests', 'tqdm')
 
-def _pip_freeze() -> bytes:
-    return subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
+
+def _pipenv_init(cwd: Path) -> subprocess.Popen:
+    """
+    Initialize pipenv
+
+    Install the package requirements into the pipenv environment of the
+    folder. If the Pipfile already lists the requirements, and the folder has
+    a Pipfile.lock which is at least as new as the Pipfile, the locked
+    environment is synced instead, which does no dependency resolution and is
+    a no-op when already satisfied.
+    """
+    pipfile, lock = Path(cwd, 'Pipfile'), Path(cwd, 'Pipfile.lock')
+    if (
+            lock.exists()
+            and lock.stat().st_mtime >= pipfile.stat().st_mtime
+            and set(_REQUIREMENTS).issubset(_pipfile_packages(pipfile))
+    ):
+        cmd = ['sync']
+    else:
+        cmd = ['install', *_REQUIREMENTS]
+
+    return subprocess.Popen(
+        [sys.executable, '-m', 'pipenv'] + cmd,
+        cwd=cwd, stdout=subprocess.PIPE
+    )
 
 
-def _pipenv_init():
-    reqs = ['requests', 'tqdm']
-    subprocess.check_output([sys.executable, '-m', 'pipenv', 'install'] + reqs)
\ No newline at end of file
+def _pipfile_packages(pipfile: Path) -> set:
+    """
+    Names of the packages listed in a Pipfile
+
+    Only the ``[packages]`` table is read, using a line based parse which is
+    sufficient for the ``name = ...`` entries that pipenv writes.
+    """
+    names, section = set(), None
+    for line in pipfile.read_text().splitlines():
+        line = line.strip()
+        if line.startswith('['):
+            section = line.strip('[]').strip()
+        elif section == 'packages' and '=' in line and not line.startswith('#'):
+            name = line.split('=', 1)[0].strip().strip('"\'')
+            names.add(name.lower().replace('_', '-'))
+    return names
@@ -35,16 +35,65 @@ artifact is treated as a first-class citizen.
 """
 import json
 import logging
+import sys
+import threading
+from functools import wraps
 from hashlib import md5
-from pathlib import Path
+from pathlib import Path, PurePath
+from types import MappingProxyType
 from typing import List, Union, Tuple, Callable
 
-from data_as_code._schema import validate_metadata
+from data_as_code._schema import validate_metadata, validate_node
 from data_as_code.exceptions import InvalidFingerprint
 
 log = logging.getLogger(__name__)
 
 
+def _intern(x):
+    """
+    Intern metadata strings
+
+    Values such as paths, step descriptions, instruction digests, checksums
+    and fingerprints are repeated for every result of a step, every lineage
+    entry that refers to the same ancestor, and every time the same metadata
+    is loaded from a file. Interning them means equal values share a single
+    string object.
+    """
+    # sys.intern rejects str subclasses, which are passed through as they are
+    return sys.intern(x) if type(x) is str else x
+
+
+_render = threading.local()
+
+
+def _render_once(to_dict: Callable) -> Callable:
+    """
+    Render each metadata object once per top-level to_dict call
+
+    Lineage is a DAG, and rendering a Metadata object renders its codified and
+    derived lineage as part of the fingerprint, then renders the full lineage
+    again. Within the outermost call the rendered dictionary of each object is
+    remembered by identity, so shared ancestors are serialized and hashed once.
+    The memo is discarded when the outermost call returns, so changes made to
+    the objects between calls are always reflected.
+    """
+    @wraps(to_dict)
+    def wrapper(self):
+        memo = getattr(_render, 'memo', None)
+        outermost = memo is None
+        if outermost:
+            memo = _render.memo = {}
+        try:
+            if id(self) not in memo:
+                memo[id(self)] = to_dict(self)
+            return memo[id(self)]
+        finally:
+            if outermost:
+                _render.memo = None
+
+    return wrapper
+
+
 class _Meta:
     """
     Base metadata class
@@ -53,12 +102,14 @@ class _Meta:
     metadata as objects.
 
     :param lineage: a list of fingerprints or _Meta objects which which make up
-        the lineage for this object.
+        the lineage for this object. This is stored as a tuple, which is empty
+        when there is no lineage.
     :param fingerprint: The expected fingerprint for this object. This will be
         checked against a calculation each time the fingerprint is called for in
         the to_dict or fingerprint methods, acting as a check to ensure that
         expected fingerprints do not drift.
     """
+    __slots__ = ('lineage', '_expected')
 
     _fingers: List[Union[str, Tuple[str, Callable]]]
     """A list of strings which identify the attribute names which should be used
@@ -69,9 +120,8 @@ class _Meta:
             self, lineage: Union[List['_Meta'], List[str]] = None,
             fingerprint: str = None
     ):
-        if lineage:
-            self.lineage = lineage
-        self._expected = fingerprint
+        self.lineage = tuple(_intern(x) for x in lineage) if lineage else ()
+        self._expected = _intern(fingerprint)
 
     def fingerprint(self) -> str:
         """
@@ -133,7 +183,15 @@ class _Meta:
         raise Exception  # exception stub for subclasses
 
     def prep_lineage(self) -> List[str]:
-        if all([isinstance(x, str) for x in self.lineage]):
+        """
+        Sorted lineage fingerprints
+
+        Lineage is homogeneous, so the first element decides whether it holds
+        fingerprint strings or metadata objects.
+        """
+        if not self.lineage:
+            return []
+        elif isinstance(self.lineage[0], str):
             return sorted(self.lineage)
         else:
             return sorted([x.fingerprint() for x in self.lineage])
@@ -147,6 +205,8 @@ class Codified(_Meta):
     the Step attributes and instructions. These metadata are derived prior to
     execution of the Recipe, and should not be modified after execution.
     """
+    __slots__ = ('_path', '_path_str', 'description', 'instructions')
+
     _fingers = ('path', 'instructions', 'lineage')
 
     def __init__(
@@ -156,21 +216,37 @@ class Codified(_Meta):
             instructions: str = None,
             **kwargs
     ):
-        self.path = Path(path) if isinstance(path, str) else path
-        self.description = description
-        self.lineage = lineage
-        self.instructions = instructions
-        if self.lineage:
-            self.lineage = [
-                x.codified if isinstance(x, Metadata) else x for x in lineage
-            ]
+        if isinstance(path, PurePath):
+            self._path, self._path_str = path, _intern(path.as_posix())
+        elif path is not None:  # normalize, but defer building a Path
+            path = PurePath(path).as_posix()
+            self._path, self._path_str = None, _intern(path)
+        else:
+            self._path, self._path_str = None, None
+        self.description = _intern(description)
+        self.instructions = _intern(instructions)
+        super().__init__(
+            lineage=[
+                x.codified if isinstance(x, Metadata) else x
+                for x in lineage or ()
+            ],
+            **kwargs
+        )
 
-        super().__init__(**kwargs)
+    @property
+    def path(self) -> Union[Path, None]:
+        """
+        Relative path, materialized from its posix string on first access
+        """
+        if self._path is None and self._path_str is not None:
+            self._path = Path(self._path_str)
+        return self._path
 
+    @_render_once
     def to_dict(self) -> dict:
         d = {}
-        if self.path:
-            d['path'] = self.path.as_posix()
+        if self._path_str is not None:
+            d['path'] = self._path_str
         if self.description:
             d['description'] = self.description
         d['instructions'] = self.instructions
@@ -191,7 +267,7 @@ class Derived(_Meta):
     metadata. This is not an actual requirement, but any non-deterministic step
     in a recipe will limit the more advanced features of this package.
     """
-    lineage: Union[List['Metadata'], List['Derived']] = None
+    __slots__ = ('checksum',)
 
     _fingers = ('checksum', 'lineage')
 
@@ -201,12 +277,16 @@ class Derived(_Meta):
             lineage: Union[List['Metadata'], List['Derived'], List[str]] = None,
             **kwargs
     ):
-        self.checksum = checksum
-        super().__init__(**kwargs)
-
-        if lineage:
-            self.lineage = [x.derived if isinstance(x, Metadata) else x for x in lineage]
+        self.checksum = _intern(checksum)
+        super().__init__(
+            lineage=[
+                x.derived if isinstance(x, Metadata) else x
+                for x in lineage or ()
+            ],
+            **kwargs
+        )
 
+    @_render_once
     def to_dict(self) -> dict:
         d = {}
         if self.checksum:
@@ -230,6 +310,7 @@ class Incidental(_Meta):
     usefulness of these metadata, they are largely ignored by the package and
     stored primarily for user reference.
     """
+    __slots__ = ('path', 'directory', 'usage', '_other_sorted')
 
     def __init__(
             self,
@@ -241,9 +322,16 @@ class Incidental(_Meta):
         self.path = Path(path) if isinstance(path, str) else path
         self.directory = Path(directory) if isinstance(directory, str) else directory
         self.usage = usage
-        self.other = kwargs
+        self._other_sorted = tuple(sorted(kwargs.items()))
         super().__init__()
 
+    @property
+    def other(self) -> MappingProxyType:
+        """
+        Read-only view of the unexpected keywords provided at construction
+        """
+        return MappingProxyType(dict(self._other_sorted))
+
     def to_dict(self) -> Union[dict, None]:
         d = {}
         if self.path:
@@ -252,11 +340,7 @@ class Incidental(_Meta):
             d['directory'] = self.directory
         if self.usage:
             d['usage'] = self.usage
-        if self.other:
-            d = {
-                k: v for k, v in
-                sorted(self.other.items(), key=lambda item: item[1], reverse=True)
-            }
+        d.update(self._other_sorted)
 
         return d if d else None
 
@@ -278,6 +362,8 @@ class Metadata(_Meta):
     exported using the ``to_dict`` method will result in an identical Metadata
     object when importing via the ``from_dict`` method.
     """
+    __slots__ = ('codified', 'derived', 'incidental')
+
     _fingers = ('codified', 'derived', 'lineage')
 
     def __init__(
@@ -291,10 +377,11 @@ class Metadata(_Meta):
         self.codified = codified
         self.derived = derived
         self.incidental = incidental
-        self.lineage = lineage
-        super().__init__(**kwargs)
+        super().__init__(lineage=lineage, **kwargs)
 
+    @_render_once
     def to_dict(self) -> dict:
+        self._render_lineage()
         d = {
             'codified': self.codified.to_dict(),
             'derived': self.derived.to_dict()
@@ -309,18 +396,72 @@ class Metadata(_Meta):
         d = {k: v for k, v in d.items() if v}
         return self._fingerprinter(d)
 
+    def _render_lineage(self):
+        """
+        Render the lineage leaf first
+
+        Walks the lineage with an explicit stack and renders each ancestor only
+        after its own lineage, so that every nested to_dict call finds its
+        lineage already in the render memo. This keeps the call depth flat no
+        matter how deep the lineage is. Ancestors which are already rendered
+        are not walked again.
+        """
+        memo = _render.memo
+        seen = set()
+        stack = [(x, False) for x in self.lineage]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                node.to_dict()
+            elif id(node) not in memo and id(node) not in seen:
+                seen.add(id(node))
+                stack.append((node, True))
+                stack.extend((x, False) for x in node.lineage)
+
     @classmethod
     def from_dict(cls, metadata: dict) -> 'Metadata':
-        validate_metadata(metadata)
-
-        dl = [cls.from_dict(x) for x in metadata.get('lineage', [])]
-        dc = metadata.get('codified', {})
-        dd = metadata.get('derived', {})
-        di = metadata.get('incidental', {})
-        fp = metadata.get('fingerprint')
-
-        mc, md, mi = Codified(**dc), Derived(**dd), Incidental(**di)
-        return cls(
-            codified=mc, derived=md, incidental=mi,
-            lineage=dl, fingerprint=fp
-        )
+        """
+        Build Metadata from a dictionary
+
+        The lineage is rebuilt leaf first using an explicit stack, so deep
+        lineage does not run into the recursion limit. The full schema is
+        applied once to the root, and the lineage fingerprints of each node
+        are checked before its lineage is expanded. Ancestors shared by
+        several branches of the lineage appear once per branch in the
+        dictionary; a memo of the dictionary and object built for each
+        fingerprint lets an identical repeat skip validation and construction.
+        """
+        memo = {}  # fingerprint -> (dictionary, Metadata)
+        built = {}  # id(dictionary) -> Metadata
+        stack = [(metadata, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not expanded:
+                hit = memo.get(node.get('fingerprint'))
+                if hit is not None and hit[0] == node:
+                    built[id(node)] = hit[1]
+                    continue
+
+                if node is metadata:  # schema covers the entire lineage
+                    validate_metadata(node)
+                else:
+                    validate_node(node)
+                stack.append((node, True))
+                lineage = node.get('lineage', [])
+                stack.extend((x, False) for x in reversed(lineage))
+                continue
+
+            dl = [built[id(x)] for x in node.get('lineage', [])]
+            dc = node.get('codified', {})
+            dd = node.get('derived', {})
+            di = node.get('incidental', {})
+            fp = node.get('fingerprint')
+
+            mc, md, mi = Codified(**dc), Derived(**dd), Incidental(**di)
+            built[id(node)] = cls(
+                codified=mc, derived=md, incidental=mi,
+                lineage=dl, fingerprint=fp
+            )
+            memo[fp] = (node, built[id(node)])
+
+        return built[id(metadata)]
@@ -3,6 +3,7 @@ import gzip
 import json
 import logging
 import os
+import shutil
 import tarfile
 from enum import Enum, auto
 from pathlib import Path
@@ -143,16 +144,27 @@ class Recipe:
             return self._compare(container)
 
     @classmethod
-    def _check_it(cls, step_name: str, steps: dict) -> set:
+    def _check_it(cls, step_name: str, steps: dict, required: set = None) -> set:
         """
         Iterate through ingredients of each step to determine which antecedents
         are required, if the cache is not available.
+
+        Each step is visited at most once, so an ingredient which is shared by
+        multiple steps only has its cache checked a single time. Providing the
+        required set from a previous call extends it in place, skipping any
+        steps which were already visited.
         """
-        required = {step_name}
-        s = steps[step_name]
-        if s.check_cache() is False:
-            for (x, y) in s.collect_ingredients().values():
-                required = required.union(cls._check_it(x, steps))
+        required = set() if required is None else required
+        pending = [step_name]
+        while pending:
+            name = pending.pop()
+            if name in required:
+                continue
+
+            required.add(name)
+            s = steps[name]
+            if s.check_cache() is False:
+                pending.extend(x for (x, y) in s.collect_ingredients().values())
         return required
 
     def _stepper(self) -> Dict[str, Step]:
@@ -183,7 +195,7 @@ class Recipe:
         if self.pickup is True:  # identify pick steps
             pickups = set()
             for k in [k for k, v in roles.items() if v is Role.PRODUCT]:
-                pickups = pickups.union(self._check_it(k, steps))
+                self._check_it(k, steps, pickups)
 
             return {k: v for k, v in steps.items() if k in pickups}
         else:
@@ -225,7 +237,8 @@ class Recipe:
             self._td.cleanup()
 
             # TODO: add a parameter to optionally control removal of unexpected files
-            expect = self._target.results() + self._target.results(metadata=True)
+            expect = set(self._target.results())
+            expect.update(self._target.results(metadata=True))
             for folder in [self._target.data, self._target.metadata]:
                 for file in [x for x in folder.rglob('*') if x.is_file()]:
                     if file not in expect:
@@ -248,17 +261,16 @@ class Recipe:
 
     @classmethod
     def _step_check(cls):
-        steps = cls._steps()
-        for ix, (k, step) in enumerate(steps.items()):
-            priors = list(steps.keys())[:ix]
+        priors = {}
+        for k, step in cls._steps().items():
             for x in step.collect_ingredients().values():
                 ingredient = x[0]
-                msg = (
+                assert ingredient in priors, (
                     f"Step '{k}' references ingredient '{ingredient}', but"
                     f" there is no preceding Step with that name in the recipe."
-                    f" Valid values are: \n {priors}"
+                    f" Valid values are: \n {list(priors)}"
                 )
-                assert ingredient in priors, msg
+            priors[k] = step
 
     @classmethod
     def _determine_roles(cls) -> Dict[str, Role]:
@@ -324,8 +336,9 @@ class Recipe:
                     for file in v.rglob('*'):
                         tar.add(file, file.relative_to(self._target.folder))
 
-        with gzip.open(self._target.gzip, 'wb') as f_out:
-            f_out.write(self._target.archive.read_bytes())
+        with self._target.archive.open('rb') as f_in:
+            with gzip.open(self._target.gzip, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out, length=1 << 20)
         self._target.archive.unlink()
 
     def _export_metadata(self):
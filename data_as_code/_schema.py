@@ -1,9 +1,9 @@
-import copy
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 import jsonschema
 
-__all__ = ['validate_metadata']
+__all__ = ['validate_metadata', 'validate_node']
 
 FINGERPRINT = {
     "description": "derived deterministic identifier of the metadata",
@@ -121,41 +121,94 @@ METADATA = {
 }
 
 
-def validate(instance: dict, schema: dict):
-    try:
-        jsonschema.validate(instance, schema)
-    except jsonschema.exceptions.ValidationError as e:
-        raise e
+def _compile(schema: dict):
+    """
+    Build a reusable validator for a static schema
+
+    The schema is checked once here, so validating against the returned object
+    skips the schema check and validator class lookup which
+    ``jsonschema.validate`` pays on every call. Errors are selected the same
+    way ``jsonschema.validate`` does.
+    """
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
+    def _validate(instance: dict):
+        errors = validator.iter_errors(instance)
+        error = jsonschema.exceptions.best_match(errors)
+        if error is not None:
+            raise error
+
+    return _validate
+
+
+_validate_metadata = _compile(METADATA)
+_NODES = {x['title']: x for x in (CODIFIED, DERIVED)}
 
 
-# noinspection PyTypeChecker
 def node_handler(node: dict, meta: dict, expected_lineage: List[str] = None):
+    if isinstance(expected_lineage, list):
+        expected_lineage = tuple(expected_lineage)
+    _node_validator(node['title'], expected_lineage)(meta)
+
+
+# noinspection PyTypeChecker
+def _node_schema(node: dict, expected_lineage: Tuple[str, ...] = None) -> dict:
+    """
+    Sub-category schema restricted to the expected lineage fingerprints
+
+    Only the parts of the schema which are changed are copied, leaving the
+    shared module level schema untouched.
+    """
     d = {
-        **copy.deepcopy(node),
+        **node,
+        'properties': dict(node['properties']),
         'definitions': dict(fingerprint=FINGERPRINT.copy()),
     }
-    if isinstance(expected_lineage, list) and len(expected_lineage) == 0:
+    if isinstance(expected_lineage, tuple) and len(expected_lineage) == 0:
         d['properties'].pop('lineage')
     elif expected_lineage:
-        d['required'] += ['lineage']
-        d['properties']['lineage']['items'] = {
-            "description": "expected fingerprint array",
-            "type": "string",
-            "enum": expected_lineage,
+        d['required'] = node['required'] + ['lineage']
+        d['properties']['lineage'] = {
+            **node['properties']['lineage'],
+            'items': {
+                "description": "expected fingerprint array",
+                "type": "string",
+                "enum": list(expected_lineage),
+            },
+            'minItems': len(expected_lineage),
+            'maxItems': len(expected_lineage),
         }
-        d['properties']['lineage']['minItems'] = len(expected_lineage)
-        d['properties']['lineage']['maxItems'] = len(expected_lineage)
 
-    validate(meta, d)
+    return d
+
+
+@lru_cache(maxsize=1024)
+def _node_validator(title: str, expected_lineage: Tuple[str, ...] = None):
+    """
+    Cached validator for a known sub-category and expected lineage
+
+    The same lineage is expected each time a step's metadata is loaded, and by
+    every result of the same step.
+    """
+    return _compile(_node_schema(_NODES[title], expected_lineage))
 
 
 def validate_metadata(meta: dict):
-    d = {
-        **METADATA,
-    }
+    _validate_metadata(meta)
+    validate_node(meta)
+
 
-    validate(meta, d)
+def validate_node(meta: dict):
+    """
+    Validate sub-category lineage of a single metadata node
 
+    Checks that the codified and derived lineage fingerprints of the node
+    match those of its lineage. Unlike ``validate_metadata``, this does not
+    apply the full schema, which already covers the whole lineage when it is
+    applied to the root of a metadata dictionary.
+    """
     lineage = meta.get('lineage', [])
     node_handler(
         CODIFIED, meta['codified'],
@@ -1,8 +1,11 @@
 import difflib
+import hashlib
 import inspect
 import json
 import logging
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
 from pathlib import Path
 from typing import Union, Dict, List, Tuple
@@ -14,7 +17,50 @@ from data_as_code._metadata import Metadata, Codified, Derived, Incidental
 log = logging.getLogger(__name__)
 
 
+def _checksum(path: Path) -> str:
+    """
+    File checksum
+
+    Calculate the md5 checksum of a file by streaming its contents through the
+    hash, so that large artifacts are never read into memory in their entirety.
+
+    :param path: the path to the file which will be hashed
+    :return: a 32 character hexadecimal md5 checksum string
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # python 3.11+
+            return hashlib.file_digest(f, 'md5').hexdigest()
+
+        if os.fstat(f.fileno()).st_size == 0:  # empty files cannot be mapped
+            return md5().hexdigest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return md5(mm).hexdigest()
+
+
+def _class_members(cls: type, kind: type) -> List[Tuple[str, object]]:
+    """
+    Class members of a type
+
+    Find the attributes of a class (including inherited attributes) which are
+    instances of the specified type, sorted by name. This is equivalent to
+    ``inspect.getmembers(cls, lambda x: isinstance(x, kind))``, but reads the
+    namespace of each class in the MRO directly instead of sorting and calling
+    getattr on every name in ``dir(cls)``.
+    """
+    members = {}
+    for klass in reversed(cls.__mro__):
+        for k, v in vars(klass).items():
+            if isinstance(v, kind):
+                members[k] = v
+            else:  # overridden by a subclass attribute of another type
+                members.pop(k, None)
+    return sorted(members.items())
+
+
 class _Ingredient:
+    __slots__ = ('step_name', 'result_name')
+
     def __init__(self, step_name: str, result_name: str = None):
         self.step_name = step_name
         self.result_name = result_name
@@ -52,6 +98,8 @@ def ingredient(step: str, result_name: str = None) -> Path:
 
 
 class _Result:
+    __slots__ = ('path',)
+
     def __init__(self, path: Union[str, Path]):
         self.path = Path(path)
 
@@ -123,11 +171,16 @@ class Step:
     _other_meta: Dict[str, str] = {}
     _data_from_cache: bool
     _ingredients: Dict[str, Metadata] = {}
+    _checksums: Dict[str, str]
+    """Checksums of results which were calculated during execution of the
+    instructions, such as while streaming a download. Results without an entry
+    are hashed from their file after the instructions complete."""
 
     metadata: Dict[str, Metadata]
 
     def __init__(self, destination: Path, antecedents: Dict[str, Dict[str, Metadata]]):
         self._guid = uuid4()
+        self._checksums = {}
         self.antecedents = antecedents
         self.destination = destination
         self.metadata = self.construct_metadata()
@@ -246,13 +299,18 @@ class Step:
         Identify all ingredients used by the step, by examining the dictionary
         of the constructed object, and checking if it is a Result class.
 
+        The scan is performed once per class, and cached on the class itself
+        because it is consulted repeatedly while a Recipe is prepared.
+
         :return: a dictionary of the results, identifying the previous step by
             name, as well as the sub-result (if applicable).
         """
-        return {
-            k: (v.step_name, v.result_name)
-            for k, v in inspect.getmembers(cls, lambda x: isinstance(x, _Ingredient))
-        }
+        if '_collected_ingredients' not in cls.__dict__:
+            cls._collected_ingredients = {
+                k: (v.step_name, v.result_name)
+                for k, v in _class_members(cls, _Ingredient)
+            }
+        return dict(cls._collected_ingredients)
 
     def _convert_ingredients(self):
         """
@@ -277,7 +335,9 @@ class Step:
 
     @classmethod
     def _get_results(cls) -> List[Tuple[str, _Result]]:
-        return inspect.getmembers(cls, lambda x: isinstance(x, _Result))
+        if '_collected_results' not in cls.__dict__:
+            cls._collected_results = _class_members(cls, _Result)
+        return list(cls._collected_results)
 
     @classmethod
     def _make_relative_path(cls, p, metadata=False) -> Path:
@@ -304,10 +364,21 @@ class Step:
                 ap.parent.mkdir(parents=True, exist_ok=True)
                 v.incidental.path = v.incidental.path.rename(ap)
 
-            v.derived = Derived(
-                checksum=md5(v.incidental.path.read_bytes()).hexdigest(),
-                lineage=v.lineage
-            )
+        # hashing releases the GIL, so multiple results are hashed concurrently
+        pending = {
+            k: v.incidental.path for k, v in self.metadata.items()
+            if k not in self._checksums
+        }
+        if len(pending) == 1:
+            (k, p), = pending.items()
+            self._checksums[k] = _checksum(p)
+        elif pending:
+            with ThreadPoolExecutor(max_workers=min(32, len(pending))) as pool:
+                checksums = pool.map(_checksum, pending.values())
+                self._checksums.update(zip(pending.keys(), checksums))
+
+        for k, v in self.metadata.items():
+            v.derived = Derived(checksum=self._checksums[k], lineage=v.lineage)
 
     def check_cache(self) -> bool:
         """
@@ -332,25 +403,32 @@ class Step:
                 mp = self._make_absolute_path(v.codified.path, metadata=True)
                 assert mp.is_file(), f"expected metadata {mp} does not exist"
 
-                meta = Metadata.from_dict(json.loads(mp.read_text()))
-                diff = difflib.unified_diff(
-                    json.dumps(v.codified.to_dict(), indent=2).split('\n'),
-                    json.dumps(meta.codified.to_dict(), indent=2).split('\n'),
+                cached = json.loads(mp.read_text())
+                codified = v.codified.to_dict()
+                diff = list(difflib.unified_diff(
+                    json.dumps(codified, indent=2).split('\n'),
+                    json.dumps(cached.get('codified'), indent=2).split('\n'),
                     'Recipe', 'Cached'
-                )
-                if list(diff):
+                ))
+                if diff:
                     log.debug(
                         f'Difference between step {self.__class__.__name__} codified '
                         f'and metadata cached in {mp.as_posix()}\n' +
-                        '\n'.join([line for line in diff])
+                        '\n'.join(diff)
                     )
 
+                # compare stored fingerprint before deserializing the lineage
+                assert (cached.get('codified') or {}).get('fingerprint') == \
+                    codified['fingerprint'], \
+                    "codified fingerprint does not match cache"
+                meta = Metadata.from_dict(cached)
                 dp = self._make_absolute_path(meta.codified.path)
 
                 assert dp.is_file(), f"expected file {dp} does not exist"
-                assert meta.codified.fingerprint() == v.codified.fingerprint(), \
+                # recalculate stored content against its stored fingerprint
+                assert meta.codified.fingerprint() == codified['fingerprint'], \
                     "codified fingerprint does not match cache"
-                assert meta.derived.checksum == md5(dp.read_bytes()).hexdigest(), \
+                assert meta.derived.checksum == _checksum(dp), \
                     f"checksum does not match file {dp}"
                 meta.incidental.path = dp
                 meta.incidental.usage = 'cached'
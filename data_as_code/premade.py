@@ -15,11 +15,8 @@ from hashlib import md5
 from pathlib import Path
 from typing import Union, Type
 
-import requests
-from tqdm import tqdm
-
 from data_as_code._metadata import Metadata
-from data_as_code._step import Step, result
+from data_as_code._step import Step, result, _checksum
 
 __all__ = [
     'source_local', 'source_http'
@@ -66,7 +63,7 @@ def source_local(path: Union[Path, str], keep=False) -> Type[Step]:
 
             return Metadata(
                 absolute_path=ap, relative_path=rp,
-                checksum_value=md5(self.output.read_bytes()).hexdigest(),
+                checksum_value=_checksum(self.output),
                 checksum_algorithm='md5',
                 lineage=[x for x in self._ingredients],
                 step_description=self.__doc__,
@@ -101,22 +98,42 @@ def source_http(url: str, keep=False) -> Type[Step]:
         _other_meta = dict(url=v_url)
 
         def instructions(self):
-            try:
-                msg = 'Downloading from URL:\n' + self._url
-                logging.info(msg)
-                print(msg)
-                response = requests.get(self._url, stream=True)
-                context = dict(
-                    total=int(response.headers.get('content-length', 0)),
-                    desc=self.output.name, miniters=1
-                )
-                with self.output.open('wb') as f:
-                    with tqdm.wrapattr(f, "write", **context) as stream:
-                        for chunk in response.iter_content(chunk_size=4096):
-                            stream.write(chunk)
-
-            except requests.HTTPError as te:
-                logging.error(f'HTTP error while attempting to download: {self._url}')
-                raise te
+            self._checksums['output'] = _download(self._url, self.output)
 
     return PremadeSourceHTTP
+
+
+def _download(url: str, path: Path) -> str:
+    """
+    Download a file via HTTP
+
+    Streams the response to the path, hashing it as it is written. This is
+    kept outside of the Step instructions, as changes to the source of the
+    instructions change the codified fingerprint of every cached download.
+
+    :return: md5 checksum of the downloaded file
+    """
+    # imported here, so that importing the package stays fast
+    import requests
+    from tqdm import tqdm
+
+    try:
+        msg = 'Downloading from URL:\n' + url
+        logging.info(msg)
+        print(msg)
+        response = requests.get(url, stream=True)
+        context = dict(
+            total=int(response.headers.get('content-length', 0)),
+            desc=path.name, miniters=1
+        )
+        h = md5()
+        with path.open('wb') as f:
+            with tqdm.wrapattr(f, "write", **context) as stream:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    stream.write(chunk)
+                    h.update(chunk)
+        return h.hexdigest()
+
+    except requests.HTTPError as te:
+        logging.error(f'HTTP error while attempting to download: {url}')
+        raise te
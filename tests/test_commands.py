@@ -0,0 +1,126 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from data_as_code import _commands
+from data_as_code._commands import _InitializeFolder, _pipenv_init
+
+
+class FakePipenv:
+    """ Stand-in for the background pipenv process """
+    def __init__(self, returncode=0):
+        self.args = ['pipenv']
+        self.returncode = returncode
+        self.communicated = False
+        self.killed = False
+
+    def communicate(self):
+        self.communicated = True
+        return b'output', None
+
+    def kill(self):
+        self.killed = True
+
+    def wait(self):
+        return self.returncode
+
+
+@pytest.fixture
+def pipenv(monkeypatch):
+    started = []
+
+    def fake(returncode=0):
+        def _init(cwd):
+            started.append(FakePipenv(returncode))
+            return started[-1]
+
+        monkeypatch.setattr(_commands, '_pipenv_init', _init)
+        return started
+
+    return fake
+
+
+def test_initialize(tmpdir, pipenv):
+    started = pipenv()
+    _InitializeFolder(tmpdir)
+    assert sorted(os.listdir(tmpdir)) == [
+        '.gitignore', 'Pipfile', 'data', 'metadata', 'recipe.py'
+    ]
+    assert len(started) == 1 and started[0].communicated
+
+
+def test_initialize_collision(tmpdir, pipenv):
+    """ A collision leaves the folder unchanged, and pipenv is not started """
+    started = pipenv()
+    Path(tmpdir, 'recipe.py').write_text('mine')
+    with pytest.raises(FileExistsError):
+        _InitializeFolder(tmpdir)
+    assert os.listdir(tmpdir) == ['recipe.py']
+    assert Path(tmpdir, 'recipe.py').read_text() == 'mine'
+    assert started == []
+
+
+def test_initialize_exist_ok(tmpdir, pipenv):
+    pipenv()
+    Path(tmpdir, 'data').mkdir()
+    Path(tmpdir, 'recipe.py').write_text('mine')
+    _InitializeFolder(tmpdir, exist_ok=True)
+    assert Path(tmpdir, 'metadata').is_dir()
+    assert Path(tmpdir, 'recipe.py').read_text() == 'this is my recipe'
+
+
+def test_initialize_pipenv_failure(tmpdir, pipenv):
+    pipenv(returncode=1)
+    with pytest.raises(subprocess.CalledProcessError):
+        _InitializeFolder(tmpdir)
+
+
+@pytest.mark.parametrize('packages,lock,offset,command', [
+    (True, False, 0, 'install'),
+    (True, True, -10, 'install'),
+    (True, True, 10, 'sync'),
+    (False, True, 10, 'install'),
+])
+def test_pipenv_init_command(tmpdir, monkeypatch, packages, lock, offset,
+                             command):
+    """
+    Sync is used only when the Pipfile lists the requirements, and the lock is
+    at least as new as the Pipfile
+    """
+    calls = []
+    monkeypatch.setattr(
+        subprocess, 'Popen', lambda args, **kwargs: calls.append(args)
+    )
+    pipfile = Path(tmpdir, 'Pipfile')
+    pipfile.write_text(
+        '[packages]\nrequests = "*"\ntqdm = "*"\n' if packages
+        else '[packages]\nnumpy = "*"\n'
+    )
+    if lock:
+        p = Path(tmpdir, 'Pipfile.lock')
+        p.touch()
+        t = pipfile.stat().st_mtime + offset
+        os.utime(p, (t, t))
+
+    _pipenv_init(tmpdir)
+    assert calls[0][:4] == [sys.executable, '-m', 'pipenv', command]
+
+
+def test_menu_without_command(capsys):
+    """ No command prints help to stderr and exits with status 1 """
+    with pytest.raises(SystemExit) as e:
+        _commands.menu([])
+    assert e.value.code == 1
+    assert 'usage: data-as-code' in capsys.readouterr().err
+
+
+def test_menu_init(tmpdir, pipenv):
+    """ The init command dispatches to folder initialization """
+    started = pipenv()
+    assert _commands._COMMANDS['init'] is _commands.initialize_folder
+    _commands.menu(['init', '-d', str(tmpdir)])
+    assert Path(tmpdir, 'recipe.py').is_file()
+    assert len(started) == 1 and started[0].communicated
@@ -1,10 +1,13 @@
+import copy
 import itertools
+import pickle
+from pathlib import Path
 
 import jsonschema.exceptions
 import pytest
 
 from data_as_code._metadata import (
-    Metadata, _Meta, Codified, Incidental
+    Metadata, _Meta, Codified, Derived, Incidental
 )
 from tests.cases import valid, meta_cases, meta_cases2, Case
 
@@ -105,3 +108,111 @@ def test_incidental_consistency(kwargs):
     for perm in itertools.permutations(kwargs):
         new_kwargs = {k: kwargs[k] for k in perm}
         assert Incidental(**new_kwargs).to_dict() == comp
+
+
+@pytest.mark.parametrize('cls', [Codified, Derived, Incidental, Metadata])
+def test_lineage_default(cls):
+    """ Lineage is consistently an empty tuple when not provided """
+    assert cls().lineage == ()
+
+
+def test_lineage_tuple():
+    """ Lineage is stored as a tuple, with Metadata reduced to sub-category """
+    m = Metadata(codified=Codified('x'), derived=Derived('a' * 32))
+    c = Codified('y', lineage=[m])
+    assert isinstance(c.lineage, tuple)
+    assert c.lineage[0] is m.codified
+
+
+@pytest.mark.parametrize('path', [
+    'sub/abc.txt', './sub/abc.txt', 'sub//abc.txt', 'sub/abc.txt/',
+    Path('sub/abc.txt')
+])
+def test_codified_path(path):
+    """ Codified path renders normalized posix, and is accessed as a Path """
+    c = Codified(path)
+    assert c.to_dict()['path'] == 'sub/abc.txt'
+    assert c.path == Path('sub/abc.txt')
+    assert c.fingerprint() == Codified(Path('sub/abc.txt')).fingerprint()
+
+
+def test_prep_lineage_reassigned():
+    """ Sorted fingerprint lineage follows reassignment of the lineage """
+    c = Codified('x', lineage=['bbbbbbbb', 'aaaaaaaa'])
+    assert c.prep_lineage() == ['aaaaaaaa', 'bbbbbbbb']
+    c.lineage = ('cccccccc',)
+    assert c.prep_lineage() == ['cccccccc']
+
+
+def _diamond():
+    def meta(name, lineage=None):
+        return Metadata(
+            codified=Codified(name, instructions='0' * 32, lineage=lineage),
+            derived=Derived(name * 32, lineage=lineage), lineage=lineage
+        )
+
+    a = meta('a')
+    return meta('d', [meta('b', [a]), meta('c', [a])])
+
+
+def test_from_dict_shared_ancestor():
+    """ An ancestor shared by several lineage branches is built only once """
+    d = _diamond().to_dict()
+    m = Metadata.from_dict(d)
+    assert m.lineage[0].lineage[0] is m.lineage[1].lineage[0]
+    assert m.to_dict() == d
+
+
+def test_incidental_other():
+    """ Unexpected keywords are added by key, and keep expected keywords """
+    d = Incidental(usage='this', z='a', y=2).to_dict()
+    assert list(d.items()) == [('usage', 'this'), ('y', 2), ('z', 'a')]
+
+
+def test_incidental_other_frozen():
+    """ Unexpected keywords cannot be changed after construction """
+    with pytest.raises(TypeError):
+        Incidental(y=2).other['y'] = 3
+
+
+def test_to_dict_renders_once(monkeypatch):
+    """ Each object in the lineage is fingerprinted once per render """
+    calls = []
+    fingerprinter = _Meta._fingerprinter
+    monkeypatch.setattr(
+        _Meta, '_fingerprinter',
+        lambda self, d: calls.append(self) or fingerprinter(self, d)
+    )
+    _diamond().to_dict()
+    assert len(calls) == len({id(x) for x in calls}) == 12
+
+
+def test_to_dict_deep_lineage():
+    """ Rendering deep lineage does not nest a to_dict call per generation """
+    m = None
+    for i in range(400):
+        lineage = [m] if m else None
+        m = Metadata(
+            codified=Codified(str(i), instructions='0' * 32, lineage=lineage),
+            derived=Derived(f'{i:032x}', lineage=lineage), lineage=lineage
+        )
+    assert m.fingerprint()
+
+
+def test_intern_str_subclass():
+    """ String subclasses are accepted, though they cannot be interned """
+    class Text(str):
+        pass
+
+    assert Codified('x', description=Text('about')).description == 'about'
+
+
+def test_metadata_pickle():
+    """ Metadata holding incidental extras can be pickled and deep-copied """
+    m = Metadata(
+        codified=Codified('x', instructions='0' * 32),
+        derived=Derived('a' * 32), incidental=Incidental('x', y=2)
+    )
+    for c in (pickle.loads(pickle.dumps(m)), copy.deepcopy(m)):
+        assert c.to_dict() == m.to_dict()
+        assert c.incidental.to_dict() == m.incidental.to_dict()
@@ -79,3 +79,42 @@ def test_pickup(tmpdir):
     R(tmpdir, pickup=True).execute()
     pickup = p4.read_text()
     assert initial == pickup
+
+
+def test_pickup_checks_shared_ingredient_once(tmpdir, monkeypatch):
+    """
+    Pickup visits each Step once
+
+    When an ingredient is shared by multiple steps (a diamond in the recipe),
+    the cache for that ingredient is only checked once while determining which
+    steps are required for a pickup execution.
+    """
+    checked = []
+    original = Step.check_cache
+
+    def check_cache(self):
+        checked.append(self.__class__.__name__)
+        return original(self)
+
+    monkeypatch.setattr(Step, 'check_cache', check_cache)
+
+    class R(Recipe):
+        trust_cache = False
+        pickup = True
+
+        class A(Step):
+            output = result('a')
+
+        class B(Step):
+            x = ingredient('A')
+
+        class C(Step):
+            x = ingredient('A')
+
+        class D(Step):
+            x = ingredient('B')
+            y = ingredient('C')
+            output = result('d')
+
+    assert set(R(tmpdir)._stepper()) == {'A', 'B', 'C', 'D'}
+    assert sorted(checked) == ['A', 'B', 'C', 'D']
@@ -1,11 +1,14 @@
+import hashlib
+from hashlib import md5
 from pathlib import Path
 
 import pytest
 
 import json
-from data_as_code import exceptions as ex
+from data_as_code import _step, exceptions as ex
 from data_as_code._metadata import Metadata
-from data_as_code._step import Step, result, ingredient, _Ingredient
+from data_as_code._recipe import Recipe, Role
+from data_as_code._step import Step, result, ingredient, _Ingredient, _checksum
 from data_as_code import exceptions as ex
 
 
@@ -196,3 +199,96 @@ def test_undefined_instructions(tmpdir):
 
     with pytest.raises(Exception):
         X(tmpdir, {})._execute(tmpdir)
+
+
+@pytest.mark.parametrize('size', [0, 10, (1 << 20) + 1])
+def test_checksum(tmpdir, size):
+    """Streamed file checksum matches an md5 of the entire file content"""
+    p = Path(tmpdir, 'file.bin')
+    p.write_bytes(b'x' * size)
+    assert _checksum(p) == md5(p.read_bytes()).hexdigest()
+
+
+@pytest.mark.parametrize('size', [0, 10, (1 << 20) + 1])
+def test_checksum_fallback(tmpdir, monkeypatch, size):
+    """Memory mapped checksum is used where hashlib.file_digest is missing"""
+    monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+    p = Path(tmpdir, 'file.bin')
+    p.write_bytes(b'x' * size)
+    assert _checksum(p) == md5(p.read_bytes()).hexdigest()
+
+
+def test_checksum_from_instructions(tmpdir):
+    """Checksums calculated during instructions are used instead of rehashing"""
+    content = b'streamed content'
+
+    class X(Step):
+        def instructions(self):
+            self.output.write_bytes(content)
+            self._checksums['output'] = md5(content).hexdigest()
+
+    x = X(tmpdir, {})._execute(tmpdir)
+    assert x.metadata['output'].derived.checksum == md5(content).hexdigest()
+
+
+def test_single_result_hashed_directly(tmpdir, monkeypatch):
+    """A single result is hashed without starting a thread pool"""
+    def no_pool(*args, **kwargs):
+        raise AssertionError('thread pool started for a single result')
+
+    monkeypatch.setattr(_step, 'ThreadPoolExecutor', no_pool)
+
+    class X(Step):
+        def instructions(self):
+            self.output.write_bytes(b'content')
+
+    x = X(tmpdir, {})._execute(tmpdir)
+    assert x.metadata['output'].derived.checksum == md5(b'content').hexdigest()
+
+
+def test_inherited_ingredients():
+    """
+    Ingredients follow attribute resolution
+
+    Ingredients declared on a parent Step are collected for the child, unless
+    the child overrides the attribute with something other than an ingredient.
+    """
+
+    class X(Step):
+        a = ingredient('A')
+        b = ingredient('B')
+
+    class Y(X):
+        b = None
+        c = ingredient('C')
+
+    assert Y.collect_ingredients() == {'a': ('A', None), 'c': ('C', None)}
+    assert X.collect_ingredients() == {'a': ('A', None), 'b': ('B', None)}
+
+
+def test_edited_cache_metadata(tmpdir):
+    """
+    Edited cache metadata is rejected
+
+    Codified metadata in a cache file which no longer matches its stored
+    fingerprint raises an error, even when the stored fingerprint itself
+    matches the recipe and the referenced file matches the stored checksum.
+    """
+    class R(Recipe):
+        keep = list(Role)
+
+        class A(Step):
+            output = result('a.txt')
+
+            def instructions(self):
+                self.output.write_text('content')
+
+    R(tmpdir).execute()
+    mp = Path(tmpdir, 'metadata', 'a.txt.json')
+    meta = json.loads(mp.read_text())
+    meta['codified']['path'] = 'b.txt'
+    mp.write_text(json.dumps(meta))
+    Path(tmpdir, 'data', 'b.txt').write_text('content')
+
+    with pytest.raises(ex.InvalidFingerprint):
+        R(tmpdir)._stepper()['A'].check_cache()